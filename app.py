@@ -1,7 +1,11 @@
+import functools
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-from snowflake.snowpark.context import get_active_session
+from snowflake.snowpark import AsyncJob
 
 # Page configuration
 st.set_page_config(
@@ -12,51 +16,109 @@ st.set_page_config(
 
 # Constants
 TABLE_NAME = "DASH_MCP_DB.DATA.FACT_SUPPORT_TICKETS"
+# Daily ticket counts per category and priority, maintained by setup.sql
+AGG_TABLE_NAME = "DASH_MCP_DB.DATA.TICKET_DAILY_AGG"
 CORTEX_SEARCH_SERVICE = "DASH_MCP_DB.DATA.SUPPORT_TICKETS_SEARCH"
+PAGE_SIZE = 20
+# Search results only carry this many characters of each description; longer
+# ones are flagged with DESCRIPTION_TRUNCATED
+DESCRIPTION_SNIPPET_LENGTH = 500
+
+# Column display settings shared by the ticket tables
+TICKET_COLUMN_CONFIG = {
+    "TICKET_ID": "Ticket ID",
+    "CUSTOMER_ID": "Customer ID",
+    "ACCOUNT_ID": "Account ID",
+    "CATEGORY": "Category",
+    "SUBCATEGORY": "Subcategory",
+    "PRIORITY": "Priority",
+    "CREATED_DATE": st.column_config.DateColumn("Created Date"),
+    "GEO_ID": "Region",
+    "DESCRIPTION_SNIPPET": st.column_config.TextColumn("Description", width="large"),
+    "DESCRIPTION_TRUNCATED": None,
+}
+
+
+def get_connection():
+    """Get Streamlit's Snowflake connection, shared across sessions.
+
+    Created on first use, so a missing or broken connection fails inside
+    main()'s guarded metadata load instead of at import time.
+    """
+    return st.connection("snowflake")
+
+
+def _arrow_to_pandas(cursor) -> pd.DataFrame:
+    """Convert a cursor's Arrow result to a DataFrame with pyarrow-backed dtypes."""
+    table = cursor.fetch_arrow_all()
+    if table is None:
+        # The connector returns no table at all for empty results
+        return pd.DataFrame(columns=[column.name for column in cursor.description])
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
 
 
 @st.cache_resource
-def get_session():
-    """Get the active Snowflake session (Streamlit in Snowflake)."""
-    return get_active_session()
+def get_snowpark_session():
+    """Get a Snowpark session on the Snowflake connection, shared across sessions.
+
+    Outside Streamlit in Snowflake, conn.session() builds a new Session on
+    every call, so it is created once here.
+    """
+    return get_connection().session()
+
 
+def run_async(query: str, params: tuple = ()) -> AsyncJob:
+    """Submit a query without waiting for its results."""
+    return get_snowpark_session().sql(query, params=list(params)).collect_nowait()
 
-@st.cache_data(ttl=300)
-def run_query(query: str) -> pd.DataFrame:
-    """Execute a query and return results as DataFrame."""
-    session = get_session()
-    return session.sql(query).to_pandas()
 
+def run_query(query: str, params: tuple = (), async_: bool = False, ttl: int = 300):
+    """Execute a query with ? bind parameters.
 
-@st.cache_data(ttl=300)
-def get_categories() -> list:
-    """Get distinct categories."""
-    df = run_query(f"SELECT DISTINCT CATEGORY FROM {TABLE_NAME} ORDER BY CATEGORY")
-    return ["All"] + df["CATEGORY"].tolist()
+    Returns the results as DataFrame, or an AsyncJob if async_ is set. User
+    input is always passed through params so the SQL text stays identical
+    across filter values and Snowflake's result cache can be reused.
 
+    Blocking results are cached for ttl seconds by conn.query, keyed on the
+    SQL text and every bind value. AsyncJobs are not cached.
+    """
+    if async_:
+        return run_async(query, params)
+    return get_connection().query(query, params=list(params) or None, ttl=ttl, show_spinner=False)
 
-@st.cache_data(ttl=300)
-def get_priorities() -> list:
-    """Get distinct priorities."""
-    df = run_query(f"SELECT DISTINCT PRIORITY FROM {TABLE_NAME} ORDER BY PRIORITY")
-    return ["All"] + df["PRIORITY"].tolist()
 
+def fetch_result(job: AsyncJob, cursor) -> pd.DataFrame:
+    """Wait for an AsyncJob and fetch its results into cursor over the Arrow result path.
+
+    Safe to call from worker threads: cursor is created by the caller, so no
+    Streamlit calls are made here.
+    """
+    cursor.get_results_from_sfqid(job.query_id)
+    return _arrow_to_pandas(cursor)
 
-@st.cache_data(ttl=300)
-def get_date_range() -> tuple:
-    """Get min and max dates."""
+
+def get_filter_metadata() -> tuple:
+    """Get filter options (categories, priorities, min date, max date) in one query."""
     df = run_query(f"""
-        SELECT MIN(CREATED_DATE) as min_date, MAX(CREATED_DATE) as max_date
+        SELECT
+            ARRAY_AGG(DISTINCT CATEGORY) WITHIN GROUP (ORDER BY CATEGORY) AS CATEGORIES,
+            ARRAY_AGG(DISTINCT PRIORITY) WITHIN GROUP (ORDER BY PRIORITY) AS PRIORITIES,
+            MIN(CREATED_DATE) AS MIN_DATE,
+            MAX(CREATED_DATE) AS MAX_DATE
         FROM {TABLE_NAME}
-    """)
-    return df["MIN_DATE"].iloc[0], df["MAX_DATE"].iloc[0]
+    """, ttl=3600)
+    # ARRAY columns are returned as JSON text
+    categories = ["All"] + json.loads(df["CATEGORIES"].iloc[0])
+    priorities = ["All"] + json.loads(df["PRIORITIES"].iloc[0])
+    return categories, priorities, df["MIN_DATE"].iloc[0], df["MAX_DATE"].iloc[0]
 
 
 def search_tickets_cortex(query: str, limit: int = 50) -> pd.DataFrame:
-    """Search tickets using Cortex Search for semantic matching."""
-    session = get_session()
-    escaped_query = query.replace("'", "''")
+    """Search tickets using Cortex Search for semantic matching.
 
+    Falls back to keyword search when Cortex Search fails, and keeps doing so
+    for the rest of the session rather than retrying it on every search.
+    """
     search_query = f"""
         SELECT
             TICKET_ID,
@@ -65,117 +127,326 @@ def search_tickets_cortex(query: str, limit: int = 50) -> pd.DataFrame:
             SUBCATEGORY,
             PRIORITY,
             CREATED_DATE,
-            DESCRIPTION
+            SUBSTR(DESCRIPTION, 1, {DESCRIPTION_SNIPPET_LENGTH}) AS DESCRIPTION_SNIPPET,
+            LENGTH(DESCRIPTION) > {DESCRIPTION_SNIPPET_LENGTH} AS DESCRIPTION_TRUNCATED
         FROM TABLE(
             SNOWFLAKE.CORTEX.SEARCH_PREVIEW(
                 '{CORTEX_SEARCH_SERVICE}',
-                '{escaped_query}',
+                ?,
                 {{
                     'columns': ['TICKET_ID', 'CUSTOMER_ID', 'CATEGORY', 'SUBCATEGORY',
                                 'PRIORITY', 'CREATED_DATE', 'DESCRIPTION'],
-                    'limit': {limit}
+                    'limit': ?
                 }}
             )
         )
     """
 
-    try:
-        return session.sql(search_query).to_pandas()
-    except Exception as e:
-        st.warning(f"Cortex Search not available, falling back to LIKE search: {e}")
-        fallback_query = f"""
-            SELECT TICKET_ID, CUSTOMER_ID, CATEGORY, SUBCATEGORY, PRIORITY, CREATED_DATE
-            FROM {TABLE_NAME}
-            WHERE CATEGORY ILIKE '%{escaped_query}%'
-               OR SUBCATEGORY ILIKE '%{escaped_query}%'
-            LIMIT {limit}
-        """
-        return run_query(fallback_query)
+    if not st.session_state.get("cortex_search_failed"):
+        try:
+            return run_query(search_query, (query, limit))
+        except Exception as e:
+            st.session_state.cortex_search_failed = True
+            st.warning(f"Cortex Search not available, falling back to keyword search: {e}")
+    # SEARCH can use the FULL_TEXT search optimization from setup.sql
+    fallback_query = f"""
+        SELECT TICKET_ID, CUSTOMER_ID, CATEGORY, SUBCATEGORY, PRIORITY, CREATED_DATE
+        FROM {TABLE_NAME}
+        WHERE SEARCH((CATEGORY, SUBCATEGORY), ?)
+        LIMIT ?
+    """
+    return run_query(fallback_query, (query, limit))
+
+
+def get_ticket_description(ticket_id) -> str:
+    """Get the full description of a single ticket."""
+    df = run_query(f"SELECT DESCRIPTION FROM {TABLE_NAME} WHERE TICKET_ID = ?", (ticket_id,))
+    return df["DESCRIPTION"].iloc[0] if len(df) > 0 else None
 
 
-def get_filtered_tickets(category: str, priority: str, start_date, end_date, limit: int = 100) -> pd.DataFrame:
-    """Get tickets with filters applied."""
-    conditions = [f"CREATED_DATE BETWEEN '{start_date}' AND '{end_date}'"]
+@functools.lru_cache(maxsize=128)
+def _build_where(category: str, priority: str, start_date, end_date) -> tuple:
+    """Build the WHERE clause and bind parameters for the sidebar filters.
+
+    Every filtered query shares this clause, so the same filters always
+    produce the same SQL text and parameters.
+    """
+    conditions = ["CREATED_DATE BETWEEN ? AND ?"]
+    params = [start_date, end_date]
 
     if category != "All":
-        conditions.append(f"CATEGORY = '{category}'")
+        conditions.append("CATEGORY = ?")
+        params.append(category)
     if priority != "All":
-        conditions.append(f"PRIORITY = '{priority}'")
+        conditions.append("PRIORITY = ?")
+        params.append(priority)
+
+    return " AND ".join(conditions), tuple(params)
 
-    where_clause = " AND ".join(conditions)
+
+def get_filtered_tickets(category: str, priority: str, start_date, end_date, cursor: tuple = None,
+                         limit: int = PAGE_SIZE, async_: bool = False):
+    """Get a page of tickets with filters applied, newest first.
+
+    Pages are keyset-paginated: cursor is the (CREATED_DATE, TICKET_ID) of
+    the last ticket on the previous page, or None for the first page.
+    """
+    where_clause, params = _build_where(category, priority, start_date, end_date)
+
+    if cursor is not None:
+        where_clause += " AND (CREATED_DATE < ? OR (CREATED_DATE = ? AND TICKET_ID < ?))"
+        params += (cursor[0], cursor[0], cursor[1])
 
     query = f"""
         SELECT TICKET_ID, CUSTOMER_ID, ACCOUNT_ID, CATEGORY, SUBCATEGORY,
                PRIORITY, CREATED_DATE, GEO_ID
         FROM {TABLE_NAME}
         WHERE {where_clause}
-        ORDER BY CREATED_DATE DESC
-        LIMIT {limit}
+        ORDER BY CREATED_DATE DESC, TICKET_ID DESC
+        LIMIT ?
     """
-    return run_query(query)
+    return run_query(query, params + (limit,), async_=async_)
 
 
-def get_tickets_over_time(category: str, priority: str, start_date, end_date) -> pd.DataFrame:
-    """Get ticket counts over time."""
-    conditions = [f"CREATED_DATE BETWEEN '{start_date}' AND '{end_date}'"]
-
-    if category != "All":
-        conditions.append(f"CATEGORY = '{category}'")
-    if priority != "All":
-        conditions.append(f"PRIORITY = '{priority}'")
+def get_dashboard_aggregates(category: str, priority: str, start_date, end_date, async_: bool = False):
+    """Get total, per-day, per-category and per-priority ticket counts in one scan.
 
-    where_clause = " AND ".join(conditions)
+    Rows are tagged by the K column ('tot', 'time', 'cat' or 'pri') according
+    to the grouping set they belong to. Every row carries the date span in
+    DAYS and AVG_PER_DAY; only the 'tot' row is read for them. Counts come
+    from the pre-aggregated AGG_TABLE_NAME rather than the fact table.
+    """
+    where_clause, params = _build_where(category, priority, start_date, end_date)
 
     query = f"""
-        SELECT CREATED_DATE, COUNT(*) as TICKET_COUNT
-        FROM {TABLE_NAME}
+        SELECT
+            CASE
+                WHEN GROUPING(CREATED_DATE) = 0 THEN 'time'
+                WHEN GROUPING(CATEGORY) = 0 THEN 'cat'
+                WHEN GROUPING(PRIORITY) = 0 THEN 'pri'
+                ELSE 'tot'
+            END AS K,
+            CREATED_DATE,
+            CATEGORY,
+            PRIORITY,
+            COALESCE(SUM(CNT), 0) AS TICKET_COUNT,
+            DATEDIFF(day, ?, ?) AS DAYS,
+            COALESCE(SUM(CNT), 0) / GREATEST(DATEDIFF(day, ?, ?), 1) AS AVG_PER_DAY
+        FROM {AGG_TABLE_NAME}
         WHERE {where_clause}
-        GROUP BY CREATED_DATE
-        ORDER BY CREATED_DATE
+        GROUP BY GROUPING SETS ((CREATED_DATE), (CATEGORY), (PRIORITY), ())
+    """
+    # The SELECT list binds come before the WHERE clause binds
+    params = (start_date, end_date, start_date, end_date) + params
+    return run_query(query, params, async_=async_)
+
+
+def split_dashboard_aggregates(df: pd.DataFrame, start_date, end_date) -> dict:
+    """Split the tagged rows of get_dashboard_aggregates into metric values and per-chart DataFrames."""
+    total_rows = df.loc[df["K"] == "tot"]
+    if len(total_rows) > 0:
+        total_row = total_rows.iloc[0]
+        metrics = {
+            "total": total_row["TICKET_COUNT"],
+            "days": total_row["DAYS"],
+            "avg_per_day": total_row["AVG_PER_DAY"],
+        }
+    else:
+        # No 'tot' row means nothing matched the filters
+        metrics = {"total": 0, "days": (end_date - start_date).days, "avg_per_day": 0}
+    time_df = df.loc[df["K"] == "time", ["CREATED_DATE", "TICKET_COUNT"]]
+    cat_df = df.loc[df["K"] == "cat", ["CATEGORY", "TICKET_COUNT"]]
+    pri_df = df.loc[df["K"] == "pri", ["PRIORITY", "TICKET_COUNT"]]
+
+    # Compact dtypes keep the figure payloads sent to the browser small
+    time_df = time_df.astype({"CREATED_DATE": "datetime64[ns]"})
+    cat_df = cat_df.astype({"CATEGORY": "category"})
+    pri_df = pri_df.astype({"PRIORITY": "category"})
+    for chart_df in (time_df, cat_df, pri_df):
+        chart_df["TICKET_COUNT"] = pd.to_numeric(chart_df["TICKET_COUNT"], downcast="unsigned")
+
+    return {
+        # Plain values, not worth keeping as a one-row DataFrame
+        "metrics": metrics,
+        "time": time_df.sort_values("CREATED_DATE", ignore_index=True),
+        "category": cat_df.sort_values("TICKET_COUNT", ascending=False, ignore_index=True),
+        "priority": pri_df.sort_values("TICKET_COUNT", ascending=False, ignore_index=True),
+    }
+
+
+@st.cache_resource(ttl=300, max_entries=256)
+def get_dashboard_slot(section: str, filters: tuple, cursor: tuple) -> dict:
+    """Get the holder for one dashboard section's result, shared by all sessions.
+
+    The holder starts empty and whichever session misses first stores the
+    shaped result under "data"; it expires, result included, after 300s.
     """
-    return run_query(query)
+    return {}
 
 
-def get_tickets_by_category(category: str, priority: str, start_date, end_date) -> pd.DataFrame:
-    """Get ticket counts by category."""
-    conditions = [f"CREATED_DATE BETWEEN '{start_date}' AND '{end_date}'"]
+def submit_dashboard_jobs(filters: tuple, cursor: tuple, slots: dict) -> dict:
+    """Submit the dashboard queries whose slots hold no result yet, keyed like slots."""
+    jobs = {}
+    if "data" not in slots["aggregates"]:
+        jobs["aggregates"] = get_dashboard_aggregates(*filters, async_=True)
+    if "data" not in slots["tickets"]:
+        # One extra row tells us whether there is a next page
+        jobs["tickets"] = get_filtered_tickets(*filters, cursor, PAGE_SIZE + 1, async_=True)
+    return jobs
 
-    if category != "All":
-        conditions.append(f"CATEGORY = '{category}'")
-    if priority != "All":
-        conditions.append(f"PRIORITY = '{priority}'")
 
-    where_clause = " AND ".join(conditions)
+def read_dashboard_result(key, job: AsyncJob, cursor, filters: tuple) -> dict:
+    """Wait for a dashboard job and shape its result for rendering."""
+    df = fetch_result(job, cursor)
+    if key == "aggregates":
+        _, _, start_date, end_date = filters
+        return split_dashboard_aggregates(df, start_date, end_date)
+    return {"tickets": df.head(PAGE_SIZE), "has_next_page": len(df) > PAGE_SIZE}
 
-    query = f"""
-        SELECT CATEGORY, COUNT(*) as TICKET_COUNT
-        FROM {TABLE_NAME}
-        WHERE {where_clause}
-        GROUP BY CATEGORY
-        ORDER BY TICKET_COUNT DESC
-    """
-    return run_query(query)
 
+def show_full_description(ticket_id):
+    """Keep the full description of ticket_id expanded in the search results."""
+    st.session_state.expanded_descriptions.add(ticket_id)
 
-def get_tickets_by_priority(category: str, priority: str, start_date, end_date) -> pd.DataFrame:
-    """Get ticket counts by priority."""
-    conditions = [f"CREATED_DATE BETWEEN '{start_date}' AND '{end_date}'"]
 
-    if category != "All":
-        conditions.append(f"CATEGORY = '{category}'")
-    if priority != "All":
-        conditions.append(f"PRIORITY = '{priority}'")
+def next_page(cursor: tuple):
+    """Move the ticket list to the page after cursor."""
+    st.session_state.page_cursors.append(cursor)
 
-    where_clause = " AND ".join(conditions)
 
-    query = f"""
-        SELECT PRIORITY, COUNT(*) as TICKET_COUNT
-        FROM {TABLE_NAME}
-        WHERE {where_clause}
-        GROUP BY PRIORITY
-        ORDER BY TICKET_COUNT DESC
+def previous_page():
+    """Move the ticket list back one page."""
+    st.session_state.page_cursors.pop()
+
+
+def render_overview(data: dict, category_count: int, figures: dict):
+    """Render the metrics row and charts from split_dashboard_aggregates output.
+
+    Built figures are stored in figures and reused on later reruns; callers
+    clear figures whenever data is reloaded.
     """
-    return run_query(query)
+    # Metrics row
+    metrics = data["metrics"]
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Tickets", f"{metrics['total']:,}")
+    with col2:
+        st.metric("Categories", category_count)
+    with col3:
+        st.metric("Date Range", f"{metrics['days']} days")
+    with col4:
+        st.metric("Avg/Day", f"{metrics['avg_per_day']:.0f}")
+
+    st.markdown("---")
+
+    # Charts section
+    st.subheader("📊 Ticket Trends")
+
+    # Time series chart
+    time_df = data["time"]
+
+    if len(time_df) > 0:
+        # Figures are reused across reruns until the aggregates are reloaded
+        fig_time = figures.get("time")
+        if fig_time is None:
+            fig_time = px.line(
+                time_df,
+                x="CREATED_DATE",
+                y="TICKET_COUNT",
+                title="Tickets Over Time",
+                labels={"CREATED_DATE": "Date", "TICKET_COUNT": "Ticket Count"}
+            )
+            fig_time.update_layout(hovermode="x unified")
+            figures["time"] = fig_time
+        st.plotly_chart(fig_time, use_container_width=True)
+
+    # Category and Priority charts side by side
+    col1, col2 = st.columns(2)
+
+    with col1:
+        cat_df = data["category"]
+        if len(cat_df) > 0:
+            fig_cat = figures.get("category")
+            if fig_cat is None:
+                fig_cat = px.bar(
+                    cat_df,
+                    x="TICKET_COUNT",
+                    y="CATEGORY",
+                    orientation="h",
+                    title="Tickets by Category",
+                    labels={"TICKET_COUNT": "Count", "CATEGORY": "Category"}
+                )
+                fig_cat.update_layout(yaxis={'categoryorder': 'total ascending'})
+                figures["category"] = fig_cat
+            st.plotly_chart(fig_cat, use_container_width=True)
+
+    with col2:
+        pri_df = data["priority"]
+        if len(pri_df) > 0:
+            fig_pri = figures.get("priority")
+            if fig_pri is None:
+                fig_pri = px.pie(
+                    pri_df,
+                    values="TICKET_COUNT",
+                    names="PRIORITY",
+                    title="Tickets by Priority"
+                )
+                figures["priority"] = fig_pri
+            st.plotly_chart(fig_pri, use_container_width=True)
+
+
+def render_ticket_list(data: dict, page_cursors: list):
+    """Render one page of tickets with a detail card and pager."""
+    st.markdown("---")
+
+    # Ticket list section
+    st.subheader(f"📋 Recent Tickets (page {len(page_cursors)})")
+
+    tickets_df = data["tickets"]
+
+    if len(tickets_df) > 0:
+        st.dataframe(
+            tickets_df,
+            column_config=TICKET_COLUMN_CONFIG,
+            hide_index=True,
+            use_container_width=True
+        )
+
+        # Render the full card for one selected ticket only
+        selected_ticket = st.selectbox("Ticket details", tickets_df["TICKET_ID"], key="recent_ticket")
+        row = next(tickets_df[tickets_df["TICKET_ID"] == selected_ticket].itertuples(index=False))
+        with st.expander(
+            f"🎫 {row.TICKET_ID} | {row.CATEGORY} | {row.PRIORITY} | {row.CREATED_DATE}",
+            expanded=True
+        ):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.write(f"**Ticket ID:** {row.TICKET_ID}")
+                st.write(f"**Customer ID:** {row.CUSTOMER_ID}")
+                st.write(f"**Account ID:** {getattr(row, 'ACCOUNT_ID', 'N/A')}")
+            with col2:
+                st.write(f"**Category:** {row.CATEGORY}")
+                st.write(f"**Subcategory:** {getattr(row, 'SUBCATEGORY', 'N/A')}")
+                st.write(f"**Priority:** {row.PRIORITY}")
+            with col3:
+                st.write(f"**Created Date:** {row.CREATED_DATE}")
+                st.write(f"**Region:** {getattr(row, 'GEO_ID', 'N/A')}")
+
+        # Pager
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("← Previous", on_click=previous_page, disabled=len(page_cursors) == 1)
+        with col2:
+            last = tickets_df.iloc[-1]
+            st.button(
+                "Next →",
+                on_click=next_page,
+                args=((last["CREATED_DATE"], last["TICKET_ID"]),),
+                disabled=not data["has_next_page"]
+            )
+    else:
+        st.info("No tickets found with the selected filters.")
 
 
 # Main app
@@ -186,11 +457,17 @@ def main():
     # Sidebar filters
     st.sidebar.header("Filters")
 
+    # Filter options are cached for an hour; let users pick up new data sooner
+    if st.sidebar.button("Refresh data"):
+        st.cache_data.clear()
+        get_dashboard_slot.clear()
+        # Also resets the ticket list page and retries Cortex Search
+        st.session_state.pop("page_filters", None)
+        st.session_state.pop("cortex_search_failed", None)
+
     # Load filter options
     try:
-        categories = get_categories()
-        priorities = get_priorities()
-        min_date, max_date = get_date_range()
+        categories, priorities, min_date, max_date = get_filter_metadata()
     except Exception as e:
         st.error(f"Failed to connect to Snowflake: {e}")
         st.info("Please ensure the app has access to the required database and tables.")
@@ -215,10 +492,15 @@ def main():
 
     # Search section
     st.markdown("---")
-    search_query = st.text_input(
-        "🔍 Search tickets",
-        placeholder="Search by description, issue type, or keywords..."
-    )
+    # Only run a search when the form is submitted, not on every rerun
+    with st.form("search"):
+        search_input = st.text_input(
+            "🔍 Search tickets",
+            placeholder="Search by description, issue type, or keywords..."
+        )
+        if st.form_submit_button("Search"):
+            st.session_state.search_query = search_input.strip()
+    search_query = st.session_state.get("search_query", "")
 
     # If searching, show search results
     if search_query:
@@ -229,18 +511,35 @@ def main():
         if len(search_results) > 0:
             st.success(f"Found {len(search_results)} matching tickets")
 
-            for _, row in search_results.iterrows():
-                with st.expander(f"🎫 {row['TICKET_ID']} - {row['CATEGORY']} ({row['PRIORITY']})"):
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.write(f"**Customer ID:** {row['CUSTOMER_ID']}")
-                        st.write(f"**Category:** {row['CATEGORY']}")
-                        st.write(f"**Subcategory:** {row.get('SUBCATEGORY', 'N/A')}")
-                    with col2:
-                        st.write(f"**Priority:** {row['PRIORITY']}")
-                        st.write(f"**Created:** {row['CREATED_DATE']}")
-                    if 'DESCRIPTION' in row and row['DESCRIPTION']:
-                        st.write(f"**Description:** {row['DESCRIPTION']}")
+            st.dataframe(
+                search_results,
+                column_config=TICKET_COLUMN_CONFIG,
+                hide_index=True,
+                use_container_width=True
+            )
+
+            # Render the full card for one selected ticket only
+            selected_ticket = st.selectbox("Ticket details", search_results["TICKET_ID"], key="search_ticket")
+            row = next(search_results[search_results["TICKET_ID"] == selected_ticket].itertuples(index=False))
+            with st.expander(f"🎫 {row.TICKET_ID} - {row.CATEGORY} ({row.PRIORITY})", expanded=True):
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write(f"**Customer ID:** {row.CUSTOMER_ID}")
+                    st.write(f"**Category:** {row.CATEGORY}")
+                    st.write(f"**Subcategory:** {getattr(row, 'SUBCATEGORY', 'N/A')}")
+                with col2:
+                    st.write(f"**Priority:** {row.PRIORITY}")
+                    st.write(f"**Created:** {row.CREATED_DATE}")
+                description = getattr(row, 'DESCRIPTION_SNIPPET', None)
+                if pd.notna(description) and description:
+                    # Load the full text only on demand; stays expanded across reruns
+                    expanded = st.session_state.setdefault("expanded_descriptions", set())
+                    if row.TICKET_ID in expanded:
+                        description = get_ticket_description(row.TICKET_ID)
+                    st.write(f"**Description:** {description}")
+                    truncated = getattr(row, 'DESCRIPTION_TRUNCATED', False)
+                    if pd.notna(truncated) and truncated and row.TICKET_ID not in expanded:
+                        st.button("Show more", on_click=show_full_description, args=(row.TICKET_ID,))
         else:
             st.warning("No tickets found matching your search.")
 
@@ -248,113 +547,67 @@ def main():
         # Show dashboard when not searching
         st.markdown("---")
 
-        # Metrics row
-        col1, col2, col3, col4 = st.columns(4)
-
-        with st.spinner("Loading metrics..."):
-            total_query = f"""
-                SELECT COUNT(*) as total FROM {TABLE_NAME}
-                WHERE CREATED_DATE BETWEEN '{start_date}' AND '{end_date}'
-            """
-            if selected_category != "All":
-                total_query = total_query.replace("WHERE", f"WHERE CATEGORY = '{selected_category}' AND")
-            if selected_priority != "All":
-                total_query = total_query.replace("WHERE", f"WHERE PRIORITY = '{selected_priority}' AND")
-
-            total_df = run_query(total_query)
-            total_tickets = total_df["TOTAL"].iloc[0]
-
-        with col1:
-            st.metric("Total Tickets", f"{total_tickets:,}")
-        with col2:
-            st.metric("Categories", len(categories) - 1)
-        with col3:
-            st.metric("Date Range", f"{(end_date - start_date).days} days")
-        with col4:
-            avg_per_day = total_tickets / max((end_date - start_date).days, 1)
-            st.metric("Avg/Day", f"{avg_per_day:.0f}")
-
-        st.markdown("---")
-
-        # Charts section
-        st.subheader("📊 Ticket Trends")
-
-        # Time series chart
-        with st.spinner("Loading charts..."):
-            time_df = get_tickets_over_time(selected_category, selected_priority, start_date, end_date)
-
-        if len(time_df) > 0:
-            fig_time = px.line(
-                time_df,
-                x="CREATED_DATE",
-                y="TICKET_COUNT",
-                title="Tickets Over Time",
-                labels={"CREATED_DATE": "Date", "TICKET_COUNT": "Ticket Count"}
-            )
-            fig_time.update_layout(hovermode="x unified")
-            st.plotly_chart(fig_time, use_container_width=True)
-
-        # Category and Priority charts side by side
-        col1, col2 = st.columns(2)
-
-        with col1:
-            cat_df = get_tickets_by_category(selected_category, selected_priority, start_date, end_date)
-            if len(cat_df) > 0:
-                fig_cat = px.bar(
-                    cat_df,
-                    x="TICKET_COUNT",
-                    y="CATEGORY",
-                    orientation="h",
-                    title="Tickets by Category",
-                    labels={"TICKET_COUNT": "Count", "CATEGORY": "Category"}
-                )
-                fig_cat.update_layout(yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig_cat, use_container_width=True)
-
-        with col2:
-            pri_df = get_tickets_by_priority(selected_category, selected_priority, start_date, end_date)
-            if len(pri_df) > 0:
-                fig_pri = px.pie(
-                    pri_df,
-                    values="TICKET_COUNT",
-                    names="PRIORITY",
-                    title="Tickets by Priority"
-                )
-                st.plotly_chart(fig_pri, use_container_width=True)
-
-        st.markdown("---")
-
-        # Ticket list section
-        st.subheader("📋 Recent Tickets")
-
-        with st.spinner("Loading tickets..."):
-            tickets_df = get_filtered_tickets(
-                selected_category,
-                selected_priority,
-                start_date,
-                end_date
-            )
-
-        if len(tickets_df) > 0:
-            # Display as expandable cards
-            for _, row in tickets_df.iterrows():
-                with st.expander(
-                    f"🎫 {row['TICKET_ID']} | {row['CATEGORY']} | {row['PRIORITY']} | {row['CREATED_DATE']}"
-                ):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.write(f"**Ticket ID:** {row['TICKET_ID']}")
-                        st.write(f"**Customer ID:** {row['CUSTOMER_ID']}")
-                        st.write(f"**Account ID:** {row.get('ACCOUNT_ID', 'N/A')}")
-                    with col2:
-                        st.write(f"**Category:** {row['CATEGORY']}")
-                        st.write(f"**Subcategory:** {row.get('SUBCATEGORY', 'N/A')}")
-                        st.write(f"**Priority:** {row['PRIORITY']}")
-                    with col3:
-                        st.write(f"**Created Date:** {row['CREATED_DATE']}")
-                        st.write(f"**Region:** {row.get('GEO_ID', 'N/A')}")
-        else:
-            st.info("No tickets found with the selected filters.")
+        # Whenever the filters change, start the ticket list from the first page
+        filters = (selected_category, selected_priority, start_date, end_date)
+        if st.session_state.get("page_filters") != filters:
+            st.session_state.page_filters = filters
+            st.session_state.page_cursors = [None]
+        page_cursors = st.session_state.page_cursors
+        figures = st.session_state.setdefault("figures", {})
+
+        # Results are shared across sessions; only query the sections that miss
+        slots = {
+            "aggregates": get_dashboard_slot("aggregates", filters, None),
+            "tickets": get_dashboard_slot("tickets", filters, page_cursors[-1]),
+        }
+        jobs = submit_dashboard_jobs(filters, page_cursors[-1], slots)
+        if jobs:
+            status = st.status("Loading dashboard...", expanded=False)
+
+        # Sections in display order, each filled as soon as its data arrives
+        overview_area = st.container()
+        tickets_area = st.container()
+
+        def render(key):
+            data = slots[key]["data"]
+            if key == "aggregates":
+                # Figures built from other aggregates (other filters, or an
+                # expired result) are stale
+                if st.session_state.get("figures_source") is not data:
+                    st.session_state.figures_source = data
+                    figures.clear()
+                with overview_area:
+                    render_overview(data, len(categories) - 1, figures)
+            else:
+                with tickets_area:
+                    render_ticket_list(data, page_cursors)
+
+        for key in slots:
+            if key not in jobs:
+                render(key)
+
+        if jobs:
+            # Downloads run in parallel; render each section as its job completes
+            try:
+                # Streamlit APIs only work on the script thread, so the workers
+                # get their cursors from here
+                raw_connection = get_connection().raw_connection
+                with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                    futures = {
+                        executor.submit(read_dashboard_result, key, job, raw_connection.cursor(), filters): key
+                        for key, job in jobs.items()
+                    }
+                    for future in as_completed(futures):
+                        key = futures[future]
+                        slots[key]["data"] = future.result()
+                        render(key)
+                        status.update(label="Charts loaded" if key == "aggregates" else "Tickets loaded")
+            except Exception as e:
+                status.update(label="Failed to load dashboard", state="error")
+                st.error(f"Failed to load dashboard data: {e}")
+                st.info("Please ensure the app has access to the required database and tables.")
+                st.stop()
+            status.update(label="Dashboard loaded", state="complete")
 
 
 if __name__ == "__main__":
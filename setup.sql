@@ -0,0 +1,17 @@
+-- One-time setup for the Support Ticket Dashboard.
+-- Run with: snow sql -f setup.sql --connection <your-connection>
+
+-- Daily ticket counts per category and priority, backing the dashboard charts
+-- and metrics so they scan pre-aggregated rows instead of the fact table.
+CREATE OR REPLACE DYNAMIC TABLE DASH_MCP_DB.DATA.TICKET_DAILY_AGG
+  TARGET_LAG = '1 hour'
+  WAREHOUSE = DEMO_WH
+AS
+  SELECT CREATED_DATE, CATEGORY, PRIORITY, COUNT(*) AS CNT
+  FROM DASH_MCP_DB.DATA.FACT_SUPPORT_TICKETS
+  GROUP BY CREATED_DATE, CATEGORY, PRIORITY;
+
+-- Lets the keyword search fallback look up tickets through SEARCH() on
+-- CATEGORY and SUBCATEGORY without scanning the whole table.
+ALTER TABLE DASH_MCP_DB.DATA.FACT_SUPPORT_TICKETS
+  ADD SEARCH OPTIMIZATION ON FULL_TEXT(CATEGORY, SUBCATEGORY);